@@ -8,12 +8,21 @@ from pathlib import Path
 from datetime import datetime
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 
 from src.processors.youtube import YouTubeProcessor, is_youtube_url
 from src.core.chunker import SemanticChunker
 from src.core.extractor import InsightExtractor
+from src.models.content_insight import ContentInsight
+
+# libyaml's C emitter is several times faster than the pure python one
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+# pydantic-core's compiled serializer for the insight tree, bound once
+_INSIGHT_SERIALIZER = ContentInsight.__pydantic_serializer__
 
 #### cli interface section ##################################################
 
@@ -43,6 +52,12 @@ Examples:
     parser.add_argument('--output', help='Output directory (default: ./outputs)')
     parser.add_argument('--markdown', action='store_true', 
                        help='Generate markdown report')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the metadata, transcript and chunk result caches')
+    parser.add_argument('--workers', type=int, default=8,
+                       help='Concurrent extraction requests (default: 8)')
+    parser.add_argument('--batch-api', action='store_true',
+                       help='Use the OpenAI Batch API (half price, may take up to 24h)')
     
     args = parser.parse_args()
     
@@ -55,7 +70,10 @@ Examples:
             if not is_youtube_url(args.url):
                 console.print("[red]Error: Only YouTube URLs are currently supported[/red]")
                 sys.exit(1)
-            result = process_youtube_video(args.url, args.goal)
+            result = process_youtube_video(
+                args.url, args.goal, use_cache=not args.no_cache, 
+                max_workers=args.workers, use_batch_api=args.batch_api
+            )
         elif args.file:
             console.print("[yellow]Audio file processing not yet implemented[/yellow]")
             sys.exit(1)
@@ -78,37 +96,37 @@ Examples:
 
 #### processing functions section ###########################################
 
-def process_youtube_video(video_url: str, extraction_goal: str):
+def process_youtube_video(
+    video_url: str, 
+    extraction_goal: str, 
+    use_cache: bool = True, 
+    max_workers: int = 8,
+    use_batch_api: bool = False
+):
     """Process YouTube video and extract insights"""
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True
-    ) as progress:
+    # a single status line at a low refresh rate, the run is almost all network wait
+    with console.status("Downloading and transcribing video...", refresh_per_second=2) as status:
         
         # step 1: download and transcribe
-        task1 = progress.add_task("Downloading and transcribing video...", total=None)
-        processor = YouTubeProcessor()
-        video_data = processor.process_video(video_url)
-        progress.remove_task(task1)
+        with YouTubeProcessor(use_cache=use_cache) as processor:
+            video_data = processor.process_video(video_url)
         
         # step 2: chunk content
-        task2 = progress.add_task("Chunking content for processing...", total=None)
+        status.update("Chunking content for processing...")
         chunker = SemanticChunker()
         chunks = chunker.chunk_transcript(video_data['transcript'])
-        progress.remove_task(task2)
         
         console.print(f"[blue]ℹ Created {len(chunks)} chunks for processing[/blue]")
         
         # step 3: extract insights
-        task3 = progress.add_task("Extracting insights with AI...", total=None)
-        extractor = InsightExtractor()
+        status.update("Extracting insights with AI...")
+        extractor = InsightExtractor(
+            use_cache=use_cache, max_workers=max_workers, use_batch_api=use_batch_api
+        )
         insights = extractor.extract_insights(
             chunks, extraction_goal, video_data['source_info']
         )
-        progress.remove_task(task3)
     
     console.print(Panel.fit(
         f"[green]Processing Complete![/green]\n\n"
@@ -124,6 +142,10 @@ def process_youtube_video(video_url: str, extraction_goal: str):
 
 #### output functions section ###############################################
 
+# (linked, plain) templates, linked is used when the item has a timestamp url
+_LIST_ITEM_TEMPLATES = ("- [{timestamp}]({url}) - {content}\n", "- {content}\n")
+_QUOTE_TEMPLATES = ("> [{timestamp}]({url}) \"{content}\"\n\n", "> \"{content}\"\n\n")
+
 def save_insights(insights, output_dir: Path, goal: str):
     """Save insights as YAML file"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -133,7 +155,10 @@ def save_insights(insights, output_dir: Path, goal: str):
     output_file = output_dir / filename
     
     with open(output_file, 'w') as f:
-        yaml.dump(insights.model_dump(), f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            _INSIGHT_SERIALIZER.to_python(insights), f, 
+            Dumper=YamlDumper, default_flow_style=False, sort_keys=False
+        )
     
     return output_file
 
@@ -143,40 +168,39 @@ def generate_markdown_report(insights, output_dir: Path):
     filename = f"{timestamp}_report.md"
     output_file = output_dir / filename
     
-    with open(output_file, 'w') as f:
-        f.write(f"# Content Analysis Report\n\n")
-        f.write(f"**Source:** {insights.source_info.title}\n")
-        f.write(f"**URL:** {insights.source_info.url}\n")
-        f.write(f"**Extraction Goal:** {insights.extraction_goal}\n")
-        f.write(f"**Processed:** {insights.source_info.processed_at}\n\n")
-        
-        if insights.key_insights:
-            f.write("## Key Insights\n\n")
-            for insight in insights.key_insights:
-                if insight.source_url and insight.timestamp_display:
-                    f.write(f"- [{insight.timestamp_display}]({insight.source_url}) - {insight.content}\n")
-                else:
-                    f.write(f"- {insight.content}\n")
-            f.write("\n")
-        
-        if insights.action_items:
-            f.write("## Action Items\n\n")
-            for action in insights.action_items:
-                if action.source_url and action.timestamp_display:
-                    f.write(f"- [{action.timestamp_display}]({action.source_url}) - {action.content}\n")
-                else:
-                    f.write(f"- {action.content}\n")
-            f.write("\n")
-        
-        if insights.quotes:
-            f.write("## Notable Quotes\n\n")
-            for quote in insights.quotes:
-                if quote.source_url and quote.timestamp_display:
-                    f.write(f"> [{quote.timestamp_display}]({quote.source_url}) \"{quote.content}\"\n\n")
-                else:
-                    f.write(f"> \"{quote.content}\"\n\n")
+    # assemble the report in memory and write it in one go
+    lines = [
+        f"# Content Analysis Report\n\n",
+        f"**Source:** {insights.source_info.title}\n",
+        f"**URL:** {insights.source_info.url}\n",
+        f"**Extraction Goal:** {insights.extraction_goal}\n",
+        f"**Processed:** {insights.source_info.processed_at}\n\n"
+    ]
+    
+    sections = (
+        ("## Key Insights\n\n", insights.key_insights, _LIST_ITEM_TEMPLATES, "\n"),
+        ("## Action Items\n\n", insights.action_items, _LIST_ITEM_TEMPLATES, "\n"),
+        ("## Notable Quotes\n\n", insights.quotes, _QUOTE_TEMPLATES, "")
+    )
+    for heading, items, templates, closing in sections:
+        if items:
+            lines.append(heading)
+            lines.extend(_format_items(items, templates))
+            lines.append(closing)
+    
+    output_file.write_text(''.join(lines), encoding='utf-8')
     
     return output_file
 
+def _format_items(items, templates) -> list[str]:
+    """Render timestamped items with the linked or plain template"""
+    linked, plain = templates
+    return [
+        linked.format(timestamp=item.timestamp_display, url=item.source_url, content=item.content)
+        if item.source_url and item.timestamp_display
+        else plain.format(content=item.content)
+        for item in items
+    ]
+
 if __name__ == '__main__':
     main()
@@ -1,5 +1,12 @@
-from typing import List, Dict, Any, Optional
-from ..models.content_insight import ContentChunk
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from ..models.content_insight import ContentChunk, WordTrack
+
+try:
+    import tiktoken
+except ImportError:  # a declared dependency, but sizing still works without it
+    tiktoken = None
+
+CHARS_PER_TOKEN = 4  # rough average for english text
 
 #### chunking strategy section ##############################################
 
@@ -10,11 +17,14 @@ class ContentChunker:
         self, 
         chunk_size: int = 2000,  # tokens per chunk
         overlap_size: int = 200,  # overlap between chunks
-        min_chunk_size: int = 500  # minimum viable chunk size
+        min_chunk_size: int = 500,  # minimum viable chunk size
+        encoding_model: str = 'gpt-4o'  # tokenizer used for sizing when tiktoken is installed
     ):
         self.chunk_size = chunk_size
         self.overlap_size = overlap_size
         self.min_chunk_size = min_chunk_size
+        self._overlap_words = max(1, overlap_size // 10)  # rough word estimate
+        self._encoding = _load_encoding(encoding_model)
     
     def chunk_transcript(
         self, 
@@ -28,37 +38,62 @@ class ContentChunker:
             transcript_data: Whisper output with segments and words
             preserve_timestamps: Whether to maintain word-level timing
         """
-        chunks = []
-        
         if 'segments' not in transcript_data:
             # fallback for simple text
             return self._chunk_plain_text(transcript_data.get('text', ''))
         
-        segments = transcript_data['segments']
-        current_chunk_text = ""
-        current_word_timestamps = []
+        return list(self.chunk_transcript_iter(
+            transcript_data['segments'], preserve_timestamps=preserve_timestamps
+        ))
+    
+    def chunk_transcript_iter(
+        self, 
+        segments: Iterable[Dict[str, Any]],
+        preserve_timestamps: bool = True
+    ) -> Iterator[ContentChunk]:
+        """
+        Yield chunks as soon as their boundary is reached
+        
+        Segments are consumed lazily, so an upstream producer can stream them in
+        and only the chunk under construction is held in memory.
+        
+        Args:
+            segments: Whisper segments with text, start/end and optional words
+            preserve_timestamps: Whether to maintain word-level timing
+        """
+        # text parts are joined once when the chunk closes, the running token
+        # count stands in for measuring the growing chunk text
+        chunk_parts: List[str] = []
+        chunk_length = 0
+        word_timestamps = WordTrack.empty()
         chunk_start_time = None
         chunk_id = 0
+        last_segment = None
+        
+        # the boundary test runs once per segment, keep its operands in locals
+        chunk_size = self.chunk_size
+        min_chunk_size = self.min_chunk_size
         
         for segment in segments:
             segment_text = segment.get('text', '')
+            segment_length = self._count_tokens(segment_text)
             segment_start = segment.get('start', 0)
             segment_words = segment.get('words', [])
             
             # start new chunk if current would exceed size
-            if (len(current_chunk_text) + len(segment_text) > self.chunk_size and 
-                len(current_chunk_text) > self.min_chunk_size):
+            if chunk_length > min_chunk_size and chunk_length + segment_length > chunk_size:
                 
-                # create chunk with overlap consideration
-                chunk = self._create_chunk(
-                    chunk_id, current_chunk_text, current_word_timestamps,
-                    chunk_start_time, segment_start
+                chunk_text = ''.join(chunk_parts)
+                yield self._create_chunk(
+                    chunk_id, chunk_text, word_timestamps,
+                    chunk_start_time, segment_start, chunk_length
                 )
-                chunks.append(chunk)
                 
                 # prepare next chunk with overlap
-                current_chunk_text = self._get_overlap_text(current_chunk_text)
-                current_word_timestamps = self._get_overlap_timestamps(current_word_timestamps)
+                overlap_text = self._get_overlap_text(chunk_text)
+                chunk_parts = [overlap_text]
+                chunk_length = self._count_tokens(overlap_text)
+                word_timestamps = self._get_overlap_timestamps(word_timestamps)
                 chunk_id += 1
                 chunk_start_time = None  # reset for next chunk
             
@@ -67,27 +102,28 @@ class ContentChunker:
                 chunk_start_time = segment_start
             
             # add segment to current chunk
-            current_chunk_text += segment_text
+            chunk_parts.append(segment_text)
+            chunk_length += segment_length
             if preserve_timestamps and segment_words:
-                current_word_timestamps.extend(segment_words)
+                word_timestamps.extend(segment_words)
+            last_segment = segment
         
         # add final chunk if it has content
-        if current_chunk_text.strip():
-            final_chunk = self._create_chunk(
-                chunk_id, current_chunk_text, current_word_timestamps,
-                chunk_start_time, segments[-1].get('end', chunk_start_time)
+        chunk_text = ''.join(chunk_parts)
+        if chunk_text.strip():
+            yield self._create_chunk(
+                chunk_id, chunk_text, word_timestamps,
+                chunk_start_time, last_segment.get('end', chunk_start_time), chunk_length
             )
-            chunks.append(final_chunk)
-        
-        return chunks
     
     def _create_chunk(
         self, 
         chunk_id: int, 
         text: str, 
-        word_timestamps: List[Dict], 
+        word_timestamps: WordTrack, 
         start_time: float, 
-        end_time: float
+        end_time: float,
+        token_count: int
     ) -> ContentChunk:
         """Create a ContentChunk object"""
         return ContentChunk(
@@ -95,20 +131,28 @@ class ContentChunker:
             start_time=start_time,
             end_time=end_time,
             text=text.strip(),
-            word_timestamps=word_timestamps
+            word_timestamps=word_timestamps,
+            token_count=token_count
         )
     
+    def _count_tokens(self, text: str) -> int:
+        """Token count with tiktoken, or a chars-per-token estimate without it"""
+        if self._encoding is not None:
+            return len(self._encoding.encode_ordinary(text))
+        return -(-len(text) // CHARS_PER_TOKEN)
+    
     def _get_overlap_text(self, text: str) -> str:
         """Extract overlap text from end of current chunk"""
-        words = text.split()
-        if len(words) <= self.overlap_size // 10:  # rough word estimate
+        # split only the tail, so the cost follows the overlap not the chunk size
+        words = text.rsplit(None, self._overlap_words)
+        if len(words) <= self._overlap_words:
             return text
-        return ' '.join(words[-(self.overlap_size // 10):])
+        return ' '.join(words[1:])
     
-    def _get_overlap_timestamps(self, timestamps: List[Dict]) -> List[Dict]:
+    def _get_overlap_timestamps(self, timestamps: WordTrack) -> WordTrack:
         """Extract overlap timestamps from end of current chunk"""
-        overlap_count = min(len(timestamps), self.overlap_size // 10)
-        return timestamps[-overlap_count:] if overlap_count > 0 else []
+        overlap_count = min(len(timestamps.words), self._overlap_words)
+        return timestamps.tail(overlap_count)
     
     def _chunk_plain_text(self, text: str) -> List[ContentChunk]:
         """Fallback chunking for plain text without timestamps"""
@@ -122,8 +166,7 @@ class ContentChunker:
             
             chunk = ContentChunk(
                 chunk_id=f"chunk_{chunk_id:03d}",
-                text=chunk_text,
-                word_timestamps=[]
+                text=chunk_text
             )
             chunks.append(chunk)
             chunk_id += 1
@@ -135,19 +178,34 @@ class ContentChunker:
 class SemanticChunker(ContentChunker):
     """Enhanced chunker that considers semantic boundaries"""
     
-    def chunk_transcript(self, transcript_data: Dict[str, Any], **kwargs) -> List[ContentChunk]:
-        """Chunk with preference for sentence and speaker boundaries"""
-        base_chunks = super().chunk_transcript(transcript_data, **kwargs)
-        
+    def chunk_transcript_iter(self, segments: Iterable[Dict[str, Any]], **kwargs) -> Iterator[ContentChunk]:
+        """Stream chunks with preference for sentence and speaker boundaries"""
+        return self._refine_chunks(super().chunk_transcript_iter(segments, **kwargs))
+    
+    def _chunk_plain_text(self, text: str) -> List[ContentChunk]:
+        """Plain text fallback with the same boundary refinement"""
+        return list(self._refine_chunks(super()._chunk_plain_text(text)))
+    
+    def _refine_chunks(self, chunks: Iterable[ContentChunk]) -> Iterator[ContentChunk]:
+        """Refine each chunk lazily as it arrives"""
         # refine chunks to break on sentence boundaries where possible
-        refined_chunks = []
-        for chunk in base_chunks:
-            refined = self._refine_chunk_boundaries(chunk)
-            refined_chunks.extend(refined)
-        
-        return refined_chunks
+        for chunk in chunks:
+            yield from self._refine_chunk_boundaries(chunk)
     
     def _refine_chunk_boundaries(self, chunk: ContentChunk) -> List[ContentChunk]:
         """Refine chunk to break on natural boundaries"""
         # for now, return as-is, but could implement sentence detection
-        return [chunk]
\ No newline at end of file
+        return [chunk]
+
+#### utility functions section ##############################################
+
+def _load_encoding(model: str):
+    """Tokenizer for model, None to size by characters when it can't be loaded"""
+    if tiktoken is None:
+        return None
+    try:
+        # the bpe file is downloaded on first use, so this fails offline
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:
+        print(f"Warning: tiktoken encoding for {model} unavailable ({e}), estimating tokens from characters")
+        return None
@@ -1,109 +1,512 @@
-import os
-from typing import Dict, Any, List
-from openai import OpenAI
-from dotenv import load_dotenv
+import re
+import asyncio
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, cycle
+from functools import lru_cache
+from typing import Dict, Any, List, Iterable, Iterator, Optional
 
+import httpx
+
+from ..utils.cache import ChunkResultCache, DEFAULT_TTL
+from ..utils.batch_api import run_batch_job
+from ..utils.openai_client import get_openai_client, get_api_keys, HTTP_TIMEOUT
 from ..models.content_insight import ContentInsight, TimestampedItem, ContentChunk
-from ..models.content_insight import seconds_to_timestamp, create_youtube_link
+from ..models.content_insight import BatchExtraction, SourceInfo
+from ..models.content_insight import seconds_to_timestamp
+
+# deletes ascii punctuation/whitespace and common typographic marks in one C-level pass
+_PUNCTUATION_TABLE = str.maketrans('', '', ''.join(
+    chr(code) for code in range(128) if not chr(code).isalnum()
+) + '\u2018\u2019\u201c\u201d\u2026\u2013\u2014')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# overlaps shorter than this are more likely coincidence than chunker overlap
+_MIN_OVERLAP_CHARS = 20
+
+#### prompt section #########################################################
+
+# kept free of per-run values so every request shares a byte-identical prefix,
+# which lets openai's automatic prompt caching reuse it
+SYSTEM_PROMPT = (
+    "# Role\n"
+    "You are an expert content analyst extracting insights from video transcripts.\n\n"
+    "# Task\n"
+    "Extract insights related to the extraction goal given in the user message.\n\n"
+    "The content is split into chunks, each starting with a `## CHUNK <chunk_id>` header. "
+    "Analyze every chunk separately.\n\n"
+    "# Guidelines\n"
+    "- Focus specifically on the extraction goal\n"
+    "- Extract key insights, actionable items, and notable quotes\n"
+    "- Be precise and specific\n"
+    "- Attribute each finding only to the chunk it appears in\n"
+    "- If no relevant content found in a chunk, return empty lists for it\n\n"
+    "# Output Format\n"
+    "Return JSON with a single field `results`, one object per chunk in input order:\n"
+    "- chunk_id: the id from the chunk header\n"
+    "- relevance_score: float 0-1, emitted before the lists\n"
+    "- key_insights: [list of important findings as strings]\n"
+    "- action_items: [list of actionable recommendations as strings]\n"
+    "- quotes: [list of notable direct quotes as strings]\n\n"
+)
+
+# strict structured outputs, the model can only answer in this shape
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "batch_extraction",
+        "strict": True,
+        "schema": BatchExtraction.model_json_schema()
+    }
+}
+
+@lru_cache(maxsize=8)
+def _goal_header(extraction_goal: str) -> str:
+    """Opening of every user message, built once per goal rather than per request"""
+    # the goal leads the user message so it extends the cached system prefix
+    # for all requests of a run, chunk text follows
+    return f"# Extraction Goal\n{extraction_goal}\n\n# Content Chunks\n"
 
 #### extraction engine section ##############################################
 
 class InsightExtractor:
     """Handles AI-powered insight extraction from content chunks"""
     
-    def __init__(self):
-        load_dotenv()
-        self.openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    def __init__(
+        self, 
+        batch_size: int = 6, 
+        max_workers: int = 8,
+        max_tokens_per_chunk: int = 800,  # output budget, decode time scales with it
+        model: str = "gpt-4o-mini",
+        escalation_model: Optional[str] = "gpt-4o",  # re-asked for borderline chunks, None disables
+        escalation_threshold: float = 0.3,
+        service_tier: Optional[str] = None,  # e.g. "flex" or "priority", account dependent
+        use_cache: bool = True,
+        cache_path: str = '.insight_cache',
+        cache_ttl: Optional[float] = DEFAULT_TTL,  # seconds a cached answer stays valid
+        semantic_cache_threshold: Optional[float] = None,  # cosine similarity, e.g. 0.92
+        embedding_model: str = "text-embedding-3-small",
+        min_relevance: float = 0.05,  # chunks scored below this are dropped in synthesis
+        use_batch_api: bool = False,  # half price, but results can take up to 24h
+        batch_poll_interval: float = 30.0,
+        stall_timeout: float = 60.0,  # seconds a streamed extraction may go without data
+        api_keys: Optional[List[str]] = None  # defaults to OPENAI_API_KEYS, then OPENAI_API_KEY
+    ):
+        # extraction requests rotate over one client per key so each key's rate
+        # limit applies to its share only, the first client also handles the
+        # batch api and embeddings
+        clients = [get_openai_client(key) for key in api_keys or get_api_keys()]
+        self.openai_client = clients[0] if clients else get_openai_client()
+        
+        # streamed extraction gets a read timeout of its own, httpx applies it to
+        # each read so a stalled generation fails fast while one that keeps
+        # sending tokens is never cut off
+        stream_timeout = httpx.Timeout(stall_timeout, connect=HTTP_TIMEOUT.connect)
+        stream_clients = [
+            client.with_options(timeout=stream_timeout) for client in clients or [self.openai_client]
+        ]
+        self._stream_client = stream_clients[0]
+        self._client_cycle = cycle(stream_clients) if len(stream_clients) > 1 else None
+        self._client_lock = threading.Lock()
+        # one extraction at a time: the cache shelf, request stats and semantic
+        # embeddings are per-run state on the instance
+        self._run_lock = threading.Lock()
+        self.model = model
+        self.escalation_model = escalation_model
+        self.escalation_threshold = escalation_threshold
+        self.batch_size = batch_size  # chunks sent per request
+        self.max_workers = max_workers  # concurrent requests, keeps us under rate limits
+        self.max_tokens_per_chunk = max_tokens_per_chunk
+        self.service_tier = service_tier
+        self.min_relevance = min_relevance
+        self.use_batch_api = use_batch_api
+        self.batch_poll_interval = batch_poll_interval
+        self.request_stats: List[Dict[str, float]] = []
+        
+        # persistent chunk result cache, optionally matching near-duplicate chunks
+        self.use_cache = use_cache
+        self._cache = ChunkResultCache(
+            cache_path,
+            (model, escalation_model or '', SYSTEM_PROMPT),
+            self.openai_client,
+            embedding_model=embedding_model,
+            similarity_threshold=semantic_cache_threshold,
+            ttl=cache_ttl
+        ) if use_cache else None
     
     def extract_insights(
         self, 
-        chunks: List[ContentChunk], 
+        chunks: Iterable[ContentChunk], 
         extraction_goal: str,
         source_info: Dict[str, Any]
     ) -> ContentInsight:
         """
         Extract insights from content chunks using iterative processing
         
+        Calls on the same extractor run one after another, concurrency comes from
+        max_workers within a call; use separate extractors to overlap runs.
+        
         Args:
-            chunks: List of content chunks to process
+            chunks: Content chunks to process, a list or a lazy chunk stream
             extraction_goal: User-specified goal (e.g., "extract book recommendations")
             source_info: Source metadata
         """
+        with self._run_lock:
+            return self._extract_insights(chunks, extraction_goal, source_info)
+    
+    def _extract_insights(
+        self, 
+        chunks: Iterable[ContentChunk], 
+        extraction_goal: str,
+        source_info: Dict[str, Any]
+    ) -> ContentInsight:
+        """extract_insights body, the caller holds the run lock"""
+        started = time.perf_counter()
+        self.request_stats = []
+        if self._cache is not None:
+            self._cache.open()
         
-        # process each chunk individually
-        chunk_insights = []
-        for chunk in chunks:
-            chunk_insight = self._process_chunk(chunk, extraction_goal)
-            chunk_insights.append(chunk_insight)
+        chunk_ids = []
+        results_by_id = {}
+        
+        def uncached_chunks() -> Iterator[ContentChunk]:
+            # reuse results for chunks already extracted with this goal and model,
+            # looked up a batch at a time so semantic lookups share one embedding call
+            for group in _batched(chunks, self.batch_size):
+                cached_by_id = self._cache.get_many(group, extraction_goal) if self._cache else {}
+                for chunk in group:
+                    chunk_ids.append(chunk.chunk_id)
+                    cached = cached_by_id.get(chunk.chunk_id)
+                    if cached is not None:
+                        results_by_id[chunk.chunk_id] = {
+                            **cached, 
+                            'chunk_id': chunk.chunk_id,  # a semantic hit carries another chunk's id
+                            'chunk_info': self._chunk_info(chunk)
+                        }
+                    else:
+                        yield chunk
+        
+        try:
+            if self.use_batch_api:
+                batch_results = self._process_with_batch_api(
+                    list(_batched(uncached_chunks(), self.batch_size)), extraction_goal
+                )
+            else:
+                batch_results = self._process_concurrently(
+                    _batched(uncached_chunks(), self.batch_size), extraction_goal
+                )
+            
+            for result in batch_results:
+                results_by_id[result['chunk_info']['chunk_id']] = result
+        finally:
+            if self._cache is not None:
+                self._cache.close()
+        
+        chunk_insights = [results_by_id[chunk_id] for chunk_id in chunk_ids]
         
         # synthesize insights across chunks
         final_insights = self._synthesize_insights(
             chunk_insights, extraction_goal, source_info
         )
+        final_insights.total_processing_time = time.perf_counter() - started
+        final_insights.metadata.update(self._summarize_request_stats())
         
         return final_insights
     
-    def _process_chunk(self, chunk: ContentChunk, extraction_goal: str) -> Dict[str, Any]:
-        """Process individual chunk to extract relevant insights"""
-        
-        system_prompt = (
-            "# Role\n"
-            "You are an expert content analyst extracting insights from video transcripts.\n\n"
-            "# Task\n"
-            f"Extract insights related to: {extraction_goal}\n\n"
-            "# Guidelines\n"
-            "- Focus specifically on the extraction goal\n"
-            "- Extract key insights, actionable items, and notable quotes\n"
-            "- Be precise and specific\n"
-            "- If no relevant content found, return empty lists\n\n"
-            "# Output Format\n"
-            "Return JSON with these fields:\n"
-            "- key_insights: [list of important findings as strings]\n"
-            "- action_items: [list of actionable recommendations as strings]\n"
-            "- quotes: [list of notable direct quotes as strings]\n"
-            "- relevance_score: float 0-1\n\n"
+    async def aextract_insights(
+        self, 
+        chunks: Iterable[ContentChunk], 
+        extraction_goal: str,
+        source_info: Dict[str, Any]
+    ) -> ContentInsight:
+        """Awaitable extract_insights for callers that already run an event loop"""
+        # the thread pool stays the concurrency mechanism: max_workers already bounds
+        # in-flight requests like a semaphore would, and the shared sync client keeps
+        # one connection pool for whisper and extraction alike; gathered calls on one
+        # extractor still take the run lock in turn, each waiting in its own thread
+        return await asyncio.to_thread(
+            self.extract_insights, chunks, extraction_goal, source_info
         )
+    
+    def _process_concurrently(
+        self, 
+        batches: Iterable[List[ContentChunk]], 
+        extraction_goal: str
+    ) -> List[Dict[str, Any]]:
+        """Run one live request per batch on the thread pool"""
+        # requests are network-bound and independent, so run them concurrently
+        # (openai client is thread-safe); batches are submitted as soon as they
+        # fill, so a streamed chunker overlaps with the first requests
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._process_batch, batch, extraction_goal)
+                for batch in batches
+            ]
+            return [result for future in futures for result in future.result()]
+    
+    def _process_batch(
+        self, 
+        batch: List[ContentChunk], 
+        extraction_goal: str
+    ) -> List[Dict[str, Any]]:
+        """Process a batch of chunks in one request, falling back to single chunks"""
+        try:
+            results = self._request_insights(batch, extraction_goal)
+        except Exception as e:
+            if len(batch) == 1:
+                print(f"Error processing chunk {batch[0].chunk_id}: {str(e)}")
+                return [self._empty_result(batch[0])]
+            
+            print(f"Error processing batch {batch[0].chunk_id}-{batch[-1].chunk_id}: "
+                  f"{str(e)}, retrying chunks individually")
+            return [
+                result 
+                for chunk in batch 
+                for result in self._process_batch([chunk], extraction_goal)
+            ]
         
-        user_prompt = (
-            f"# Extraction Goal\n"
-            f"{extraction_goal}\n\n"
-            f"# Content Chunk\n"
-            f"Timestamp Range: {seconds_to_timestamp(chunk.start_time or 0)} - "
-            f"{seconds_to_timestamp(chunk.end_time or 0)}\n\n"
-            f"Content:\n{chunk.text}\n\n"
-        )
+        return self._collect_results(batch, extraction_goal, results)
+    
+    def _collect_results(
+        self, 
+        batch: List[ContentChunk], 
+        extraction_goal: str,
+        results: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Match parsed results to the batch's chunks, re-requesting any the model skipped"""
+        results = self._escalate_borderline(batch, extraction_goal, results)
+        
+        chunk_insights = []
+        for chunk in batch:
+            result = results.get(chunk.chunk_id)
+            if result is not None:
+                self._store_result(chunk, extraction_goal, result)
+                result['chunk_info'] = self._chunk_info(chunk)
+                chunk_insights.append(result)
+            elif len(batch) > 1:
+                # model skipped this chunk in the batched answer, ask for it alone
+                chunk_insights.extend(self._process_batch([chunk], extraction_goal))
+            else:
+                chunk_insights.append(self._empty_result(chunk))
         
+        return chunk_insights
+    
+    def _store_result(self, chunk: ContentChunk, extraction_goal: str, result: Dict[str, Any]):
+        """Cache a fresh result, a failed write (full disk, dbm error) only costs the cache entry"""
+        if self._cache is None:
+            return
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",  # using gpt-4o as gpt-5 might not be available
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1
-            )
-            
-            import json
-            result = json.loads(response.choices[0].message.content)
-            result['chunk_info'] = {
-                'chunk_id': chunk.chunk_id,
-                'start_time': chunk.start_time,
-                'end_time': chunk.end_time,
-                'word_timestamps': chunk.word_timestamps
-            }
-            
-            return result
-            
+            self._cache.set(chunk, extraction_goal, result)
         except Exception as e:
-            print(f"Error processing chunk {chunk.chunk_id}: {str(e)}")
-            return {
-                'key_insights': [],
-                'action_items': [],
-                'quotes': [],
-                'relevance_score': 0.0,
-                'chunk_info': {'chunk_id': chunk.chunk_id}
+            print(f"Error caching result for {chunk.chunk_id}: {str(e)}, keeping it uncached")
+    
+    def _escalate_borderline(
+        self, 
+        batch: List[ContentChunk], 
+        extraction_goal: str,
+        results: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Re-ask the larger model for chunks the default model kept but scored low"""
+        if not self.escalation_model or self.escalation_model == self.model:
+            return results
+        
+        # clearly irrelevant and clearly relevant chunks keep the cheap answer,
+        # only the ones in between are worth a second opinion
+        borderline = [
+            chunk for chunk in batch
+            if chunk.chunk_id in results 
+            and self.min_relevance <= results[chunk.chunk_id]['relevance_score'] < self.escalation_threshold
+        ]
+        if not borderline:
+            return results
+        
+        try:
+            escalated = self._request_insights(borderline, extraction_goal, self.escalation_model)
+        except Exception as e:
+            print(f"Error escalating {len(borderline)} chunks to {self.escalation_model}: "
+                  f"{str(e)}, keeping {self.model} results")
+            return results
+        
+        return {
+            **results, 
+            **{chunk.chunk_id: escalated[chunk.chunk_id] for chunk in borderline if chunk.chunk_id in escalated}
+        }
+    
+    def _request_insights(
+        self, 
+        batch: List[ContentChunk], 
+        extraction_goal: str,
+        model: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Send one extraction request for a batch and return results keyed by chunk_id"""
+        request_body = self._request_body(batch, extraction_goal)
+        if model:
+            request_body['model'] = model
+        
+        # streamed so a stalled generation hits the stream clients' short read
+        # timeout instead of holding a worker until the client-wide one
+        request_started = time.perf_counter()
+        stream = self._next_client().chat.completions.create(
+            **request_body, stream=True, stream_options={"include_usage": True}
+        )
+        
+        parts = []
+        usage = None
+        with stream:
+            for event in stream:
+                if event.choices and event.choices[0].delta.content:
+                    parts.append(event.choices[0].delta.content)
+                if event.usage:
+                    usage = event.usage  # only sent on the final event
+        
+        self._record_usage(
+            time.perf_counter() - request_started,
+            usage.prompt_tokens if usage else 0,
+            usage.completion_tokens if usage else 0
+        )
+        
+        return self._parse_results(''.join(parts))
+    
+    def _next_client(self):
+        """Round-robin over the key pool, next() on a shared cycle needs the lock"""
+        if self._client_cycle is None:
+            return self._stream_client
+        with self._client_lock:
+            return next(self._client_cycle)
+    
+    def _request_body(self, batch: List[ContentChunk], extraction_goal: str) -> Dict[str, Any]:
+        """Chat completion parameters for one batch, shared by live and batch api requests"""
+        
+        # the chunker repeats the previous chunk's tail at the start of each chunk,
+        # when that chunk precedes it in the same request the model already has it
+        texts = [_compact_text(chunk.text) for chunk in batch]
+        texts = [texts[0]] + [
+            _strip_overlap(text, previous) for previous, text in zip(texts, texts[1:])
+        ]
+        
+        user_prompt = _goal_header(extraction_goal) + ''.join(
+            f"## CHUNK {chunk.chunk_id}\n"
+            f"[ts {seconds_to_timestamp(chunk.start_time or 0)}-"
+            f"{seconds_to_timestamp(chunk.end_time or 0)}]\n"
+            f"{text}\n\n"
+            for chunk, text in zip(batch, texts)
+        )
+        
+        # only send service_tier when configured, not every account supports every tier
+        tier_options = {'service_tier': self.service_tier} if self.service_tier else {}
+        
+        return dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            response_format=RESPONSE_FORMAT,
+            temperature=0.1,
+            max_tokens=self.max_tokens_per_chunk * len(batch),
+            stop=["\n\n\n"],  # cuts off runaway whitespace that json output modes sometimes emit
+            **tier_options
+        )
+    
+    def _parse_results(self, content: str) -> Dict[str, Dict[str, Any]]:
+        """Validate the model's json answer and return results keyed by chunk_id"""
+        # parsed and validated in one pass by pydantic's rust core, a malformed
+        # answer raises here and sends the batch down the single chunk fallback
+        parsed = BatchExtraction.model_validate_json(content)
+        
+        return {result.chunk_id: result.model_dump() for result in parsed.results}
+    
+    #### batch api section ######################################################
+    
+    def _process_with_batch_api(
+        self, 
+        batches: List[List[ContentChunk]], 
+        extraction_goal: str
+    ) -> List[Dict[str, Any]]:
+        """Submit every batch as one openai batch job and wait for it to finish"""
+        if not batches:
+            return []
+        
+        # the batch endpoint has its own pricing tier, service_tier does not apply
+        request_bodies = [
+            {
+                key: value 
+                for key, value in self._request_body(batch, extraction_goal).items() 
+                if key != 'service_tier'
             }
+            for batch in batches
+        ]
+        
+        job_started = time.perf_counter()
+        job, responses = run_batch_job(self.openai_client, request_bodies, self.batch_poll_interval)
+        job_latency = time.perf_counter() - job_started
+        
+        chunk_insights = []
+        for batch, body in zip(batches, responses):
+            try:
+                if body is None:
+                    raise ValueError("no response in the job output")
+                results = self._parse_results(body['choices'][0]['message']['content'])
+            except Exception as e:
+                # failed, expired or unparseable requests fall back to live calls
+                print(f"Batch job {job.id} ({job.status}) has no result for "
+                      f"{batch[0].chunk_id}-{batch[-1].chunk_id}: {str(e)}, retrying live")
+                chunk_insights.extend(self._process_batch(batch, extraction_goal))
+                continue
+            
+            usage = body.get('usage') or {}
+            self._record_usage(
+                job_latency / len(batches),
+                usage.get('prompt_tokens', 0),
+                usage.get('completion_tokens', 0)
+            )
+            chunk_insights.extend(self._collect_results(batch, extraction_goal, results))
+        
+        return chunk_insights
+    
+    def _chunk_info(self, chunk: ContentChunk) -> Dict[str, Any]:
+        """Per-chunk metadata attached to each result for timestamping"""
+        return {
+            'chunk_id': chunk.chunk_id,
+            'start_time': chunk.start_time,
+            'end_time': chunk.end_time,
+            'word_timestamps': chunk.word_timestamps
+        }
+    
+    #### request stats section ##################################################
+    
+    def _record_usage(self, latency: float, prompt_tokens: int, completion_tokens: int):
+        """Record one request's numbers, list.append is atomic so worker threads can call it"""
+        self.request_stats.append({
+            'latency': latency,
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens
+        })
+    
+    def _summarize_request_stats(self) -> Dict[str, Any]:
+        """Aggregate per-request token and latency numbers for tuning batch/token limits"""
+        latency = sum(stat['latency'] for stat in self.request_stats)
+        completion_tokens = sum(stat['completion_tokens'] for stat in self.request_stats)
+        
+        return {
+            'llm_requests': len(self.request_stats),
+            'prompt_tokens': sum(stat['prompt_tokens'] for stat in self.request_stats),
+            'completion_tokens': completion_tokens,
+            # decode throughput, the number max_tokens_per_chunk trades against
+            'tokens_per_second': round(completion_tokens / latency, 1) if latency else 0.0
+        }
+    
+    def _empty_result(self, chunk: ContentChunk) -> Dict[str, Any]:
+        """Placeholder result for a chunk that could not be processed"""
+        return {
+            'key_insights': [],
+            'action_items': [],
+            'quotes': [],
+            'relevance_score': 0.0,
+            'chunk_info': {'chunk_id': chunk.chunk_id}
+        }
     
     def _synthesize_insights(
         self, 
@@ -117,36 +520,44 @@ class InsightExtractor:
         all_actions = []
         all_quotes = []
         
-        # collect and timestamp all insights
+        # the link prefix is fixed for the source, same format as create_youtube_link
+        url_prefix = (
+            f"{source_info['url']}&t=" 
+            if source_info.get('source_type') == 'youtube' and source_info.get('url') else None
+        )
+        fields = (
+            ('key_insights', all_insights),
+            ('action_items', all_actions),
+            ('quotes', all_quotes)
+        )
+        
+        # collect and timestamp all insights in one pass, items from the same chunk
+        # share the chunk start time so its display string and link are built once
         for chunk_result in chunk_insights:
-            chunk_info = chunk_result.get('chunk_info', {})
-            
-            # process key insights (handle both structured and plain string formats)
-            for insight in chunk_result.get('key_insights', []):
-                content = str(insight)  # just convert to string regardless of format
-                timestamped_insight = self._create_timestamped_item_with_reference(
-                    content, '', chunk_info, source_info
-                )
-                all_insights.append(timestamped_insight)
+            # skip chunks the model judged irrelevant before building any items
+            relevance = chunk_result.get('relevance_score')
+            if isinstance(relevance, (int, float)) and relevance < self.min_relevance:
+                continue
             
-            # process action items
-            for action in chunk_result.get('action_items', []):
-                content = str(action)
-                timestamped_action = self._create_timestamped_item_with_reference(
-                    content, '', chunk_info, source_info
-                )
-                all_actions.append(timestamped_action)
+            chunk_info = chunk_result.get('chunk_info', {})
+            start_time = chunk_info.get('start_time', 0)
+            timestamp_display = seconds_to_timestamp(start_time)
+            source_url = f"{url_prefix}{int(start_time)}s" if url_prefix else None
             
-            # process quotes
-            for quote in chunk_result.get('quotes', []):
-                content = str(quote)
-                timestamped_quote = self._create_timestamped_item_with_reference(
-                    content, '', chunk_info, source_info
+            # handle both structured and plain string formats by converting to string;
+            # every value is already the right type, so pydantic validation is skipped
+            for field, target in fields:
+                target.extend(
+                    TimestampedItem.model_construct(
+                        content=str(item),
+                        timestamp_seconds=start_time,
+                        timestamp_display=timestamp_display,
+                        source_url=source_url
+                    )
+                    for item in chunk_result.get(field, ())
                 )
-                all_quotes.append(timestamped_quote)
         
         # create final insight object
-        from ..models.content_insight import SourceInfo
         source = SourceInfo(**source_info)
         
         return ContentInsight(
@@ -158,63 +569,68 @@ class InsightExtractor:
             processing_chunks=len(chunk_insights)
         )
     
-    def _create_timestamped_item_with_reference(
-        self, 
-        content: str,
-        text_reference: str,
-        chunk_info: Dict[str, Any], 
-        source_info: Dict[str, Any]
-    ) -> TimestampedItem:
-        """Create timestamped item with precise timestamp based on text reference"""
-        
-        # get the chunk start time - this is the main issue
-        chunk_start = chunk_info.get('start_time', 0)
-        
-        # for now, just use chunk start time since text reference matching isn't working
-        start_time = chunk_start
-        
-        timestamp_display = seconds_to_timestamp(start_time)
-        
-        # create clickable URL for YouTube
-        source_url = None
-        if source_info.get('source_type') == 'youtube' and source_info.get('url'):
-            source_url = create_youtube_link(source_info['url'], start_time)
-        
-        return TimestampedItem(
-            content=content,
-            timestamp_seconds=start_time,
-            timestamp_display=timestamp_display,
-            source_url=source_url
-        )
-    
     def _find_precise_timestamp(self, text_reference: str, chunk_info: Dict[str, Any]) -> float:
         """Find precise timestamp for a text reference using word-level timestamps"""
         chunk_start = chunk_info.get('start_time', 0)
         
-        if not text_reference or not chunk_info.get('word_timestamps'):
+        track = chunk_info.get('word_timestamps')
+        if not text_reference or track is None or not track.words:
             return chunk_start
         
-        # find the first few words from the text reference
-        ref_words = [word.lower().strip() for word in text_reference.split()[:3]]
+        # find the first few words from the text reference, cleaned the same way
+        # as the indexed transcript words so "cat," still finds "Cat."
+        ref_words = [
+            clean_word 
+            for word in text_reference.split()[:3] 
+            if (clean_word := word.lower().translate(_PUNCTUATION_TABLE))
+        ]
+        if not ref_words:
+            return chunk_start
         
-        for word_data in chunk_info.get('word_timestamps', []):
-            word_text = word_data.get('word', '').lower().strip()
-            # remove punctuation for better matching
-            clean_word = ''.join(c for c in word_text if c.isalnum())
-            
-            if clean_word and any(clean_word in ref_word or ref_word in clean_word for ref_word in ref_words):
-                return word_data.get('start', chunk_start)
+        # first start time of every cleaned word, built once per chunk and kept on
+        # chunk_info so later references into the same chunk are plain lookups
+        word_index = chunk_info.get('word_index')
+        if word_index is None:
+            word_index = {}
+            for word, start in zip(track.words, track.starts):
+                word_index.setdefault(word.lower().translate(_PUNCTUATION_TABLE), start)
+            word_index.pop('', None)
+            chunk_info['word_index'] = word_index
+        
+        # earliest reference word wins, as the old in-order scan returned
+        matches = [word_index[word] for word in ref_words if word in word_index]
+        if matches:
+            return min(matches)
         
         # fallback to chunk start time
         return chunk_start
+
+#### utility functions section ##############################################
+
+def _batched(items: Iterable[ContentChunk], size: int) -> Iterator[List[ContentChunk]]:
+    """Yield lists of up to size items (itertools.batched needs python 3.12)"""
+    iterator = iter(items)
+    while batch := list(islice(iterator, max(1, size))):
+        yield batch
+
+def _compact_text(text: str) -> str:
+    """Collapse whitespace runs, transcript segments often carry doubled spaces and newlines"""
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+def _strip_overlap(text: str, previous: str) -> str:
+    """Drop the start of text that repeats the end of previous, if any"""
+    # the overlap can't be longer than either text, so only previous's tail is searched
+    tail = previous[-len(text):]
+    probe = text[:_MIN_OVERLAP_CHARS]
+    if len(probe) < _MIN_OVERLAP_CHARS:
+        return text
     
-    def _create_timestamped_item(
-        self, 
-        content: str, 
-        chunk_info: Dict[str, Any], 
-        source_info: Dict[str, Any]
-    ) -> TimestampedItem:
-        """Create timestamped item with appropriate linking (legacy method)"""
-        return self._create_timestamped_item_with_reference(
-            content, '', chunk_info, source_info
-        )
\ No newline at end of file
+    # earliest match in the tail is the longest overlap
+    start = tail.find(probe)
+    while start != -1:
+        overlap = len(tail) - start
+        if text.startswith(tail[start:]):
+            return text[overlap:].lstrip() or text
+        start = tail.find(probe, start + 1)
+    
+    return text
@@ -1,5 +1,7 @@
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from array import array
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Any, Iterable, NamedTuple
 from datetime import datetime
 
 #### content models section ##################################################
@@ -21,13 +23,39 @@ class SourceInfo(BaseModel):
     duration_seconds: Optional[float] = None
     processed_at: datetime
 
+class WordTrack(NamedTuple):
+    """Word-level timing as parallel arrays instead of one dict per word"""
+    words: List[str]
+    starts: array  # array('d') of start seconds
+    ends: array    # array('d') of end seconds
+    
+    @classmethod
+    def empty(cls) -> "WordTrack":
+        return cls([], array('d'), array('d'))
+    
+    def extend(self, word_data: Iterable[Dict[str, Any]]):
+        """Append whisper word dicts to the parallel arrays"""
+        for word in word_data:
+            self.words.append(word.get('word', ''))
+            self.starts.append(word.get('start', 0.0))
+            self.ends.append(word.get('end', 0.0))
+    
+    def tail(self, count: int) -> "WordTrack":
+        """Copy of the last count words"""
+        if count <= 0:
+            return WordTrack.empty()
+        return WordTrack(self.words[-count:], self.starts[-count:], self.ends[-count:])
+
 class ContentChunk(BaseModel):
     """Individual chunk of processed content"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)  # array.array in WordTrack
+    
     chunk_id: str
     start_time: Optional[float] = None
     end_time: Optional[float] = None
     text: str
-    word_timestamps: List[Dict[str, Any]] = []  # whisper word-level data
+    word_timestamps: WordTrack = Field(default_factory=WordTrack.empty)  # whisper word-level data
+    token_count: Optional[int] = None  # size as counted by the chunker, for budgeting
 
 #### insight models section #################################################
 
@@ -49,15 +77,38 @@ class ContentInsight(BaseModel):
     # flexible additional data based on extraction goal
     custom_extractions: Dict[str, List[TimestampedItem]] = {}
 
+#### extraction response models section #####################################
+
+class ChunkExtraction(BaseModel):
+    """Model output for one chunk, field order is the order the model writes them"""
+    model_config = ConfigDict(extra='forbid')  # strict structured outputs need a closed schema
+    
+    chunk_id: str
+    relevance_score: float
+    key_insights: List[str]
+    action_items: List[str]
+    quotes: List[str]
+
+class BatchExtraction(BaseModel):
+    """Model output for a batched extraction request"""
+    model_config = ConfigDict(extra='forbid')
+    
+    results: List[ChunkExtraction]
+
 #### utility functions section ##############################################
 
 def seconds_to_timestamp(seconds: float) -> str:
     """Convert seconds to MM:SS or HH:MM:SS format"""
+    return _format_whole_seconds(int(seconds))
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
+    """Formatting behind seconds_to_timestamp, items in a chunk share the same second"""
     if seconds < 3600:
-        mins, secs = divmod(int(seconds), 60)
+        mins, secs = divmod(seconds, 60)
         return f"{mins}:{secs:02d}"
     else:
-        hours, remainder = divmod(int(seconds), 3600)
+        hours, remainder = divmod(seconds, 3600)
         mins, secs = divmod(remainder, 60)
         return f"{hours}:{mins:02d}:{secs:02d}"
 
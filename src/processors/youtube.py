@@ -1,23 +1,57 @@
 import os
+import re
+import json
+import hashlib
+import queue
 import tempfile
-from typing import Dict, Any, Optional
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 import yt_dlp
-from openai import OpenAI
-from dotenv import load_dotenv
 
 from ..models.content_insight import SourceInfo
+from ..utils.cache import LLMCache
+from ..utils.openai_client import get_openai_client
 from datetime import datetime
 
+WHISPER_MAX_BYTES = 24 * 1024 * 1024  # 24MB to stay under the 25MB upload limit
+CHUNK_BITRATE = 64_000  # bits per second for re-encoded chunks, plenty for speech
+MAX_COPY_BITRATE = 96_000  # mp3 sources up to this are split without re-encoding
+CHUNK_OVERLAP_SECONDS = 1  # audio shared by adjacent chunks so seams lose no words
+AUDIO_EXTENSIONS = ('.mp3', '.m4a', '.webm', '.opus')  # what yt-dlp leaves for bestaudio
+
+# watch urls with the v parameter anywhere in the query, short links and embeds
+# in one pass; v= has to start a parameter so "dev=1" or "nav=2" never match,
+# and the lazy group keeps the first v parameter when there are several
+_VIDEO_ID_PATTERN = re.compile(
+    r'(?:youtube\.com/watch\?(?:[^#]*?&)??v=|youtu\.be/|youtube\.com/embed/)([^&\n?#]+)'
+)
+
+# the host has to be youtube itself, so "notyoutube.com" or a youtube link in
+# another site's query string don't pass; the scheme is optional for pasted urls
+_YOUTUBE_HOST_PATTERN = re.compile(
+    r'(?:https?://)?(?:www\.|m\.|music\.)?(?:youtube\.com|youtu\.be)(?:[/?#]|$)', re.IGNORECASE
+)
+
 #### youtube processor section ##############################################
 
 class YouTubeProcessor:
     """Handles YouTube video processing with Whisper transcription"""
     
-    def __init__(self):
-        load_dotenv()
-        self.openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    def __init__(
+        self, 
+        max_transcribe_workers: int = 5,
+        use_cache: bool = True,
+        cache_path: str = '.youtube_cache'
+    ):
+        self.openai_client = get_openai_client()
+        self.max_transcribe_workers = max_transcribe_workers  # concurrent whisper uploads
+        
+        # metadata (views, title edits) goes stale within a day, a transcript of
+        # identical audio never does but is kept a week like the insight cache
+        self._metadata_cache = LLMCache(f"{cache_path}_metadata", ttl=24 * 3600) if use_cache else None
+        self._transcript_cache = LLMCache(f"{cache_path}_transcripts", ttl=7 * 24 * 3600) if use_cache else None
         
         # yt-dlp configuration for audio extraction
         self.ydl_opts = {
@@ -27,26 +61,48 @@ class YouTubeProcessor:
             'outtmpl': '%(title)s.%(ext)s',
             'noplaylist': True,
         }
+        
+        # one YoutubeDL per options set, built on first use and kept for the
+        # processor's lifetime since construction loads every extractor
+        self._info_ydl: Optional[yt_dlp.YoutubeDL] = None
+        self._download_ydl: Optional[yt_dlp.YoutubeDL] = None
     
-    def process_video(self, video_url: str) -> Dict[str, Any]:
+    def __enter__(self) -> "YouTubeProcessor":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """Release the shared YoutubeDL instances (cookie jar, open sockets)"""
+        for ydl in (self._info_ydl, self._download_ydl):
+            if ydl is not None:
+                ydl.close()
+        self._info_ydl = self._download_ydl = None
+    
+    def process_video(self, video_url: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Process YouTube video: extract audio and transcribe with timestamps
         
         Args:
             video_url: YouTube video URL
+            refresh: Ignore cached metadata and transcripts (results are still stored)
             
         Returns:
             Dict containing transcript data and source info
         """
-        # extract video metadata first
-        video_info = self._get_video_info(video_url)
+        # extract video metadata first, the raw extractor result is reused for
+        # the download (None when the metadata came from the cache); this is
+        # deliberately sequential, running the two side by side would mean a
+        # second extraction and the download can't start before one finishes
+        video_info, extracted_info = self._get_video_info(video_url, refresh)
         
         # download audio to temporary file
         with tempfile.TemporaryDirectory() as temp_dir:
-            audio_path = self._download_audio(video_url, temp_dir)
+            audio_path, audio_info = self._download_audio(video_url, temp_dir, extracted_info)
             
             # transcribe with word-level timestamps
-            transcript_data = self._transcribe_audio(audio_path)
+            transcript_data = self._transcribe_audio(audio_path, refresh, audio_info)
             
         # create source info
         source_info = SourceInfo(
@@ -59,231 +115,347 @@ class YouTubeProcessor:
         
         return {
             'transcript': transcript_data,
-            'source_info': source_info.dict(),
+            'source_info': source_info.model_dump(),
             'video_metadata': video_info
         }
     
-    def _get_video_info(self, video_url: str) -> Dict[str, Any]:
-        """Extract video metadata without downloading"""
-        ydl_opts_info = {**self.ydl_opts, 'skip_download': True}
+    def _get_video_info(
+        self, 
+        video_url: str, 
+        refresh: bool = False
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Extract video metadata without downloading, with the raw yt-dlp info when fetched"""
+        # keyed on the video id so different url forms of one video share an entry
+        video_id = extract_video_id(video_url) or video_url
+        if not refresh:
+            cached = _cache_get(self._metadata_cache, video_id)
+            if cached is not None:
+                return cached, None
         
-        with yt_dlp.YoutubeDL(ydl_opts_info) as ydl:
-            try:
-                info = ydl.extract_info(video_url, download=False)
-                return {
-                    'title': info.get('title'),
-                    'duration': info.get('duration'),
-                    'uploader': info.get('uploader'),
-                    'upload_date': info.get('upload_date'),
-                    'view_count': info.get('view_count'),
-                    'description': info.get('description', '')[:500] + '...'  # truncated
-                }
-            except Exception as e:
-                raise ValueError(f"Failed to extract video info: {str(e)}")
+        if self._info_ydl is None:
+            self._info_ydl = yt_dlp.YoutubeDL({**self.ydl_opts, 'skip_download': True})
+        
+        try:
+            info = self._info_ydl.extract_info(video_url, download=False)
+            # the key can be present with a None value, and only cut text gets an ellipsis
+            description = info.get('description') or ''
+            video_info = {
+                'title': info.get('title'),
+                'duration': info.get('duration'),
+                'uploader': info.get('uploader'),
+                'upload_date': info.get('upload_date'),
+                'view_count': info.get('view_count'),
+                'description': description[:500] + '...' if len(description) > 500 else description
+            }
+        except Exception as e:
+            raise ValueError(f"Failed to extract video info: {str(e)}")
+        
+        _cache_set(self._metadata_cache, video_id, video_info)
+        return video_info, info
     
-    def _download_audio(self, video_url: str, output_dir: str) -> str:
-        """Download audio from YouTube video"""
-        ydl_opts = {
-            **self.ydl_opts,
-            'outtmpl': os.path.join(output_dir, '%(title)s.%(ext)s')
-        }
+    def _download_audio(
+        self, 
+        video_url: str, 
+        output_dir: str, 
+        info: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Download audio from YouTube video, reusing already extracted info when given
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            try:
-                # extract info to get the actual filename
+        Returns the audio path and what yt-dlp knows about the stream (duration,
+        codec, bitrate in bits per second), empty when the file had to be searched for
+        """
+        if self._download_ydl is None:
+            self._download_ydl = yt_dlp.YoutubeDL(dict(self.ydl_opts))
+        ydl = self._download_ydl
+        
+        # the output dir changes per video, the shared instance resolves outtmpl
+        # against its home path
+        ydl.params['paths'] = {'home': output_dir}
+        
+        try:
+            # extract info first, unless the caller has it
+            if info is None:
                 info = ydl.extract_info(video_url, download=False)
-                filename = ydl.prepare_filename(info)
-                
-                # download the audio
-                ydl.download([video_url])
-                
-                # find the downloaded file (yt-dlp might change extension)
-                base_path = Path(filename).with_suffix('')
-                for ext in ['.mp3', '.m4a', '.webm', '.opus']:
-                    potential_path = str(base_path) + ext
-                    if os.path.exists(potential_path):
-                        return potential_path
-                
-                # fallback: find any audio file in the directory
-                audio_files = [f for f in os.listdir(output_dir) 
-                              if f.lower().endswith(('.mp3', '.m4a', '.webm', '.opus'))]
-                if audio_files:
-                    return os.path.join(output_dir, audio_files[0])
-                
-                raise FileNotFoundError("Downloaded audio file not found")
-                
-            except Exception as e:
-                raise ValueError(f"Failed to download audio: {str(e)}")
+            
+            # download the audio from the extracted info, ydl.download would run
+            # the whole extractor (page fetch, signature decoding) a second time
+            result = ydl.process_ie_result(info, download=True)
+            
+            # yt-dlp reports the final path, after any postprocessor renamed it
+            for download in result.get('requested_downloads') or []:
+                filepath = download.get('filepath')
+                if filepath and os.path.exists(filepath):
+                    # yt-dlp drops keys from the download entry that equal the
+                    # top-level info, which the selected format was merged into
+                    abr = download.get('abr') or result.get('abr')  # kbps
+                    return filepath, {
+                        'duration': download.get('duration') or result.get('duration'),
+                        'codec': download.get('acodec') or result.get('acodec'),
+                        'bitrate': int(abr * 1000) if abr else None
+                    }
+            
+            # fallback: find any audio file in the directory, is_file uses the type
+            # the directory read already returned instead of a stat per entry
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(AUDIO_EXTENSIONS) and entry.is_file():
+                        return entry.path, {}
+            
+            raise FileNotFoundError("Downloaded audio file not found")
+            
+        except Exception as e:
+            raise ValueError(f"Failed to download audio: {str(e)}")
     
-    def _transcribe_audio(self, audio_path: str) -> Dict[str, Any]:
+    def _transcribe_audio(
+        self, 
+        audio_path: str, 
+        refresh: bool = False, 
+        audio_info: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """Transcribe audio using OpenAI Whisper with word-level timestamps"""
         try:
-            file_size = os.path.getsize(audio_path)
-            max_size = 24 * 1024 * 1024  # 24MB limit
+            # keyed on the audio content, a re-download of the same video still hits;
+            # file_digest hashes through a fixed buffer instead of reading the whole file
+            with open(audio_path, 'rb') as audio_file:
+                file_size = os.fstat(audio_file.fileno()).st_size
+                audio_hash = hashlib.file_digest(audio_file, 'sha256').hexdigest()
+            if not refresh:
+                cached = _cache_get(self._transcript_cache, audio_hash)
+                if cached is not None:
+                    return cached
             
-            if file_size <= max_size:
+            if file_size <= WHISPER_MAX_BYTES:
                 # small enough, transcribe directly
-                return self._transcribe_single_file(audio_path)
+                transcript_data = self._transcribe_single_file(audio_path)
             else:
                 # too large, split into chunks and transcribe separately
-                return self._transcribe_large_file(audio_path)
+                transcript_data = self._transcribe_large_file(audio_path, file_size, audio_info)
                 
         except Exception as e:
             raise ValueError(f"Failed to transcribe audio: {str(e)}")
+        
+        _cache_set(self._transcript_cache, audio_hash, transcript_data)
+        return transcript_data
     
     def _transcribe_single_file(self, audio_path: str) -> Dict[str, Any]:
         """Transcribe a single audio file"""
+        # the open handle is streamed into the multipart body in small reads, a
+        # Path here would make the SDK read the whole file into memory first
         with open(audio_path, 'rb') as audio_file:
-            response = self.openai_client.audio.transcriptions.create(
+            # the raw body skips building a pydantic model per word and segment
+            # only to copy each one into a dict again
+            raw_response = self.openai_client.audio.transcriptions.with_raw_response.create(
                 model="whisper-1",
                 file=audio_file,
                 response_format="verbose_json",
                 timestamp_granularities=["word", "segment"]
             )
-            
-            # convert to dict format for easier manipulation
-            segments = []
-            if hasattr(response, 'segments'):
-                for seg in response.segments:
-                    segments.append({
-                        'start': seg.start,
-                        'end': seg.end,
-                        'text': seg.text
-                    })
-            
-            words = []
-            if hasattr(response, 'words'):
-                for word in response.words:
-                    words.append({
-                        'start': word.start,
-                        'end': word.end,
-                        'word': word.word
-                    })
-            
-            return {
-                'text': response.text,
-                'segments': segments,
-                'words': words,
-                'language': getattr(response, 'language', 'unknown'),
-                'duration': getattr(response, 'duration', None)
-            }
+        response = json.loads(raw_response.content)
+        
+        # segments carry decoder internals (tokens, logprobs) that are dropped here,
+        # word entries are already just start, end and word
+        segments = [
+            {'start': seg['start'], 'end': seg['end'], 'text': seg['text']}
+            for seg in response.get('segments') or []
+        ]
+        
+        return {
+            'text': response['text'],
+            'segments': segments,
+            'words': response.get('words') or [],
+            'language': response.get('language', 'unknown'),
+            'duration': response.get('duration')
+        }
     
-    def _transcribe_large_file(self, audio_path: str) -> Dict[str, Any]:
-        """Split large audio file and transcribe in chunks"""
+    def _transcribe_large_file(
+        self, 
+        audio_path: str, 
+        file_size: int, 
+        audio_info: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Split large audio file into overlapping windows and transcribe in chunks"""
         import ffmpeg
         
-        # get audio duration
-        probe = ffmpeg.probe(audio_path)
-        duration = float(probe['format']['duration'])
+        # get audio duration, codec and bitrate, from yt-dlp's stream info when it
+        # has them so only files from elsewhere pay for an ffprobe run
+        audio_info = audio_info or {}
+        if audio_info.get('duration'):
+            duration = float(audio_info['duration'])
+            codec = audio_info.get('codec')
+            source_bitrate = audio_info.get('bitrate') or 0
+        else:
+            probe = ffmpeg.probe(audio_path)
+            duration = float(probe['format']['duration'])
+            stream = next((s for s in probe['streams'] if s.get('codec_type') == 'audio'), {})
+            codec = stream.get('codec_name')
+            source_bitrate = int(stream.get('bit_rate') or probe['format'].get('bit_rate') or 0)
+        
+        # the average over the whole file is good enough when neither source had one
+        if not source_bitrate and duration:
+            source_bitrate = int(file_size * 8 / duration)
+        
+        # a low-bitrate mp3 is cut as-is: a pure remux runs at disk speed and
+        # skips a lossy second encode; anything else is re-encoded to CHUNK_BITRATE
+        copy_codec = codec == 'mp3' and 0 < source_bitrate <= MAX_COPY_BITRATE
+        if copy_codec:
+            codec_args = {'acodec': 'copy'}
+            chunk_bitrate = source_bitrate
+        else:
+            codec_args = {'acodec': 'mp3', 'audio_bitrate': f"{CHUNK_BITRATE // 1000}k"}
+            chunk_bitrate = CHUNK_BITRATE
         
-        # split into 10-minute chunks (should be under 25MB each)
-        chunk_duration = 600  # 10 minutes
-        chunks = []
+        # size chunks to fill whisper's upload limit at the chunk bitrate, less a
+        # little headroom for mp3 framing and container overhead (~52 minutes at 64k)
+        chunk_duration = WHISPER_MAX_BYTES // (chunk_bitrate // 8) - 10
+        
+        # each window runs CHUNK_OVERLAP_SECONDS into the next, so words cut at a
+        # seam are heard whole by one of the two chunks; the last window starts
+        # early enough to reach the end without being pure overlap
+        window_starts = range(
+            0, max(int(duration) - CHUNK_OVERLAP_SECONDS, 1), chunk_duration - CHUNK_OVERLAP_SECONDS
+        )
         
         base_dir = os.path.dirname(audio_path)
         base_name = os.path.splitext(os.path.basename(audio_path))[0]
         
-        for i, start_time in enumerate(range(0, int(duration), chunk_duration)):
-            chunk_path = os.path.join(base_dir, f"{base_name}_chunk_{i:03d}.mp3")
-            
-            # extract chunk
-            (
-                ffmpeg
-                .input(audio_path, ss=start_time, t=chunk_duration)
-                .output(chunk_path, acodec='mp3', audio_bitrate='64k')
-                .overwrite_output()
-                .run(quiet=True)
-            )
-            
-            # transcribe chunk
-            chunk_result = self._transcribe_single_file(chunk_path)
-            
-            # adjust timestamps to account for chunk offset
-            if chunk_result.get('segments'):
-                for segment in chunk_result['segments']:
-                    segment['start'] += start_time
-                    segment['end'] += start_time
-            
-            if chunk_result.get('words'):
-                for word in chunk_result['words']:
-                    word['start'] += start_time
-                    word['end'] += start_time
-            
-            chunks.append(chunk_result)
-            
-            # cleanup chunk file
-            os.remove(chunk_path)
+        # a producer thread hands finished chunks to the uploads while ffmpeg is
+        # still cutting, the bounded queue keeps it from running far ahead
+        chunk_queue: queue.Queue = queue.Queue(maxsize=2)
+        producer_errors = []
         
-        # combine all chunks
-        combined_text = ' '.join(chunk['text'] for chunk in chunks)
-        combined_segments = []
-        combined_words = []
+        def produce_chunks():
+            try:
+                for i, start_time in enumerate(window_starts):
+                    chunk_path = os.path.join(base_dir, f"{base_name}_chunk_{i:03d}.mp3")
+                    # ss on the input seeks before decoding instead of reading up to start
+                    (
+                        ffmpeg
+                        .input(audio_path, ss=start_time, t=chunk_duration)
+                        .output(chunk_path, **codec_args)
+                        .global_args('-loglevel', 'error', '-nostats')  # keeps the stderr pipe small
+                        .overwrite_output()
+                        .run(quiet=True)
+                    )
+                    chunk_queue.put((chunk_path, float(start_time)))
+            except Exception as e:
+                producer_errors.append(e)
+            finally:
+                chunk_queue.put(None)  # sentinel, no more chunks
         
+        producer = threading.Thread(target=produce_chunks, daemon=True)
+        producer.start()
+        
+        # whisper uploads are independent network calls, so run them concurrently;
+        # futures are kept in chunk order for reassembly
+        with ThreadPoolExecutor(max_workers=self.max_transcribe_workers) as executor:
+            futures = []
+            while (chunk_file := chunk_queue.get()) is not None:
+                futures.append(executor.submit(self._transcribe_chunk, *chunk_file))
+            chunks = [future.result() for future in futures]
+        
+        producer.join()
+        if producer_errors:
+            raise producer_errors[0]
+        
+        # combine all chunks, dropping what each seam's overlap transcribed twice
+        combined_segments: List[Dict[str, Any]] = []
+        combined_words: List[Dict[str, Any]] = []
         for chunk in chunks:
-            combined_segments.extend(chunk.get('segments', []))
-            combined_words.extend(chunk.get('words', []))
+            _append_after_seam(combined_segments, combined_words, chunk)
         
         return {
-            'text': combined_text,
+            # whisper's text is its segment texts joined, so rebuild it from the merged ones
+            'text': ' '.join(segment['text'].strip() for segment in combined_segments),
             'segments': combined_segments,
             'words': combined_words,
             'language': chunks[0].get('language', 'unknown') if chunks else 'unknown',
             'duration': duration
         }
     
-    def _compress_audio_if_needed(self, audio_path: str) -> str:
-        """Compress audio if it exceeds Whisper's size limit"""
-        import ffmpeg
+    def _transcribe_chunk(self, chunk_path: str, start_time: float) -> Dict[str, Any]:
+        """Transcribe one chunk file, shift its timestamps to the source timeline and delete it"""
+        chunk_result = self._transcribe_single_file(chunk_path)
         
-        file_size = os.path.getsize(audio_path)
-        max_size = 24 * 1024 * 1024  # 24MB to stay under 25MB limit
+        # adjust timestamps to account for chunk offset
+        if chunk_result.get('segments'):
+            for segment in chunk_result['segments']:
+                segment['start'] += start_time
+                segment['end'] += start_time
         
-        if file_size <= max_size:
-            return audio_path
+        if chunk_result.get('words'):
+            for word in chunk_result['words']:
+                word['start'] += start_time
+                word['end'] += start_time
         
-        # create compressed version
-        compressed_path = audio_path.rsplit('.', 1)[0] + '_compressed.mp3'
+        # cleanup chunk file
+        os.remove(chunk_path)
         
-        try:
-            # compress audio: reduce bitrate and convert to mp3
-            (
-                ffmpeg
-                .input(audio_path)
-                .output(compressed_path, acodec='mp3', audio_bitrate='64k')
-                .overwrite_output()
-                .run(quiet=True)
-            )
-            
-            # verify the compressed file is smaller
-            compressed_size = os.path.getsize(compressed_path)
-            if compressed_size < max_size:
-                return compressed_path
-            else:
-                # if still too large, use original and let it fail with better error
-                return audio_path
-                
-        except Exception as e:
-            print(f"Warning: Audio compression failed: {e}")
-            return audio_path
+        return chunk_result
 
 #### utility functions section ##############################################
 
-def extract_video_id(video_url: str) -> Optional[str]:
-    """Extract video ID from various YouTube URL formats"""
-    import re
+def _cache_get(cache: Optional[LLMCache], key: str) -> Optional[Dict[str, Any]]:
+    """Read one entry, opening the shelf only for the lookup"""
+    if cache is None:
+        return None
+    cache.open()
+    try:
+        return cache.get(key)
+    finally:
+        cache.close()
+
+def _cache_set(cache: Optional[LLMCache], key: str, value: Dict[str, Any]):
+    """Store one entry, opening the shelf only for the write"""
+    if cache is None:
+        return
+    cache.open()
+    try:
+        cache.set(key, value)
+    finally:
+        cache.close()
+
+def _append_after_seam(
+    segments: List[Dict[str, Any]], 
+    words: List[Dict[str, Any]], 
+    chunk: Dict[str, Any]
+):
+    """
+    Append one chunk's segments and words, skipping speech the previous chunk already has
+
+    The seam is where the previous chunk's last word ends: incoming words that
+    start before it were heard in the overlap and are dropped. A segment running
+    across the seam keeps only the words after it, anything earlier is skipped.
+    """
+    if words:
+        seam = words[-1]['end']
+    elif segments:
+        seam = segments[-1]['end']  # no word timestamps, segment ends are the best there is
+    else:
+        seam = float('-inf')
     
-    patterns = [
-        r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([^&\n?#]+)',
-        r'youtube\.com/watch\?.*v=([^&\n?#]+)',
-    ]
+    new_words = [word for word in chunk.get('words', []) if word['start'] >= seam]
     
-    for pattern in patterns:
-        match = re.search(pattern, video_url)
-        if match:
-            return match.group(1)
+    for segment in chunk.get('segments', []):
+        if segment['start'] >= seam:
+            segments.append(segment)
+        elif segment['end'] > seam:
+            kept = [word for word in new_words if word['start'] < segment['end']]
+            if kept:
+                segments.append({
+                    'start': kept[0]['start'],
+                    'end': segment['end'],
+                    # whisper segment texts start with a space, the chunker joins them as-is
+                    'text': ' ' + ' '.join(word['word'].strip() for word in kept)
+                })
     
-    return None
+    words.extend(new_words)
+
+def extract_video_id(video_url: str) -> Optional[str]:
+    """Extract video ID from various YouTube URL formats"""
+    match = _VIDEO_ID_PATTERN.search(video_url)
+    return match.group(1) if match else None
 
 def is_youtube_url(url: str) -> bool:
     """Check if URL is a valid YouTube URL"""
-    return any(domain in url.lower() for domain in ['youtube.com', 'youtu.be'])
\ No newline at end of file
+    return _YOUTUBE_HOST_PATTERN.match(url) is not None
\ No newline at end of file
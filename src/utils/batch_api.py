@@ -0,0 +1,74 @@
+import io
+import json
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from openai import OpenAI
+
+BATCH_ENDPOINT = '/v1/chat/completions'
+_FINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+#### batch job section ######################################################
+
+def run_batch_job(
+    client: OpenAI,
+    request_bodies: List[Dict[str, Any]],
+    poll_interval: float = 30.0
+) -> Tuple[Any, List[Optional[Dict[str, Any]]]]:
+    """
+    Run chat completion requests as one openai batch job and wait for it
+
+    Returns the finished job and each request's response body in request order,
+    None for requests the job has no answer for (failed, expired, cancelled).
+    """
+    requests_jsonl = ''.join(
+        json.dumps({
+            'custom_id': f"request_{index}",
+            'method': 'POST',
+            'url': BATCH_ENDPOINT,
+            'body': body
+        }) + '\n'
+        for index, body in enumerate(request_bodies)
+    )
+
+    input_file = client.files.create(
+        file=('batch_requests.jsonl', io.BytesIO(requests_jsonl.encode('utf-8'))),
+        purpose='batch'
+    )
+    job = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window='24h'
+    )
+
+    # the jsonl files count against the account's file storage, so they are
+    # removed once the answers are read, whatever happened to the job
+    try:
+        while job.status not in _FINAL_STATUSES:
+            time.sleep(poll_interval)
+            job = client.batches.retrieve(job.id)
+
+        # demultiplex by custom_id, lines come back in no particular order
+        bodies: Dict[str, Dict[str, Any]] = {}
+        if job.output_file_id:
+            output = client.files.content(job.output_file_id).text
+            for line in output.splitlines():
+                if line.strip():
+                    answer = json.loads(line)
+                    body = (answer.get('response') or {}).get('body')
+                    if body is not None:
+                        bodies[answer['custom_id']] = body
+    finally:
+        _delete_files(client, input_file.id, job.output_file_id, job.error_file_id)
+
+    return job, [bodies.get(f"request_{index}") for index in range(len(request_bodies))]
+
+#### utility functions section ##############################################
+
+def _delete_files(client: OpenAI, *file_ids: Optional[str]):
+    """Delete uploaded or generated files, a failed delete only leaves the file behind"""
+    for file_id in filter(None, file_ids):
+        try:
+            client.files.delete(file_id)
+        except Exception as e:
+            print(f"Warning: could not delete batch file {file_id}: {str(e)}")
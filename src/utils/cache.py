@@ -0,0 +1,229 @@
+import math
+import time
+import shelve
+import hashlib
+import operator
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Iterable, Optional, Tuple
+
+from openai import OpenAI
+
+from ..models.content_insight import ContentChunk
+
+# shelve key holding the embedding index, chunk keys are hex digests so they can't collide
+_SEMANTIC_INDEX_KEY = '__semantic_index__'
+
+DEFAULT_TTL = 7 * 24 * 3600  # a week, long enough for iterating on the same sources
+
+#### llm response cache section #############################################
+
+class LLMCache:
+    """
+    Persistent cache for model answers and other costly lookups
+
+    Exact hits are looked up by a digest of everything that shapes the answer.
+    When a similarity threshold is set, misses can also be served by the most
+    similar stored embedding within the same scope (same goal, model and prompt).
+    Entries expire after ttl seconds and are dropped when next read.
+    shelve is not thread-safe, so every access goes through one lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        similarity_threshold: Optional[float] = None,  # e.g. 0.92, None disables the semantic tier
+        max_semantic_entries: int = 2048,
+        ttl: Optional[float] = DEFAULT_TTL  # seconds, None keeps entries forever
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_entries = max_semantic_entries
+        self._shelf: Optional[shelve.Shelf] = None
+        # cache key -> (scope, unit vector), least recently used first
+        self._semantic_index: "OrderedDict[str, Tuple[str, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def semantic(self) -> bool:
+        return self.similarity_threshold is not None
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Digest of the given parts, separated so ('ab', 'c') and ('a', 'bc') differ"""
+        return hashlib.blake2b('\x00'.join(parts).encode()).hexdigest()
+
+    def open(self):
+        with self._lock:
+            self._shelf = shelve.open(self.path)
+            if self.semantic:
+                self._semantic_index = self._shelf.get(_SEMANTIC_INDEX_KEY, OrderedDict())
+
+    def close(self):
+        with self._lock:
+            if self._shelf is None:
+                return
+            if self.semantic:
+                self._shelf[_SEMANTIC_INDEX_KEY] = self._semantic_index
+            self._shelf.close()
+            self._shelf = None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored answer for an exact key"""
+        with self._lock:
+            value = self._read(key)
+            if value is not None and key in self._semantic_index:
+                self._semantic_index.move_to_end(key)
+            return value
+
+    def get_similar(self, scope: str, embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """Return the answer stored for the closest embedding in scope, if close enough"""
+        vector = _normalize(embedding)
+
+        with self._lock:
+            best_key, best_score = None, self.similarity_threshold
+            for key, (entry_scope, entry_vector) in self._semantic_index.items():
+                if entry_scope != scope:
+                    continue
+                # vectors are unit length, so the dot product is the cosine similarity
+                score = sum(map(operator.mul, vector, entry_vector))
+                if score > best_score:
+                    best_key, best_score = key, score
+
+            if best_key is None:
+                return None
+            self._semantic_index.move_to_end(best_key)
+            return self._read(best_key)
+
+    def set(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        scope: Optional[str] = None,
+        embedding: Optional[List[float]] = None
+    ):
+        """Store an answer, and index its embedding when the semantic tier is on"""
+        with self._lock:
+            expires_at = time.time() + self.ttl if self.ttl is not None else None
+            self._shelf[key] = (expires_at, value)
+            if not (self.semantic and scope is not None and embedding is not None):
+                return
+
+            self._semantic_index[key] = (scope, _normalize(embedding))
+            self._semantic_index.move_to_end(key)
+            while len(self._semantic_index) > self.max_semantic_entries:
+                # only the index entry goes, the exact answer stays on disk
+                self._semantic_index.popitem(last=False)
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored value for key, dropping it when expired (caller holds the lock)"""
+        entry = self._shelf.get(key)
+        if entry is None:
+            return None
+
+        # entries written before expiry existed are bare dicts, treat them as stale
+        expires_at, value = entry if isinstance(entry, tuple) else (0.0, None)
+        if expires_at is not None and expires_at < time.time():
+            del self._shelf[key]
+            self._semantic_index.pop(key, None)
+            return None
+        return value
+
+#### chunk result cache section #############################################
+
+class ChunkResultCache:
+    """
+    Extraction results per chunk, stored in an LLMCache
+
+    Keyed on the chunk text plus everything else that shapes the answer (goal,
+    models, prompt), so re-chunked runs still hit. With a similarity threshold,
+    misses are embedded in one request and served from the closest earlier chunk.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        answer_parts: Tuple[str, ...],  # models, prompt and whatever else the answer depends on
+        client: OpenAI,
+        embedding_model: str = "text-embedding-3-small",
+        similarity_threshold: Optional[float] = None,
+        ttl: Optional[float] = DEFAULT_TTL
+    ):
+        self._cache = LLMCache(path, similarity_threshold=similarity_threshold, ttl=ttl)
+        self._answer_parts = answer_parts
+        self._client = client
+        self.embedding_model = embedding_model
+        # chunk_id -> embedding of this run's misses, so fresh answers are indexed
+        # under the vector they were looked up with
+        self._embeddings: Dict[str, List[float]] = {}
+
+    def open(self):
+        self._embeddings = {}
+        self._cache.open()
+
+    def close(self):
+        self._cache.close()
+
+    def get_many(self, chunks: Iterable[ContentChunk], extraction_goal: str) -> Dict[str, Dict[str, Any]]:
+        """Return cached model outputs keyed by chunk_id"""
+        cached_by_id = {}
+        misses = []
+        for chunk in chunks:
+            cached = self._cache.get(self._key(chunk, extraction_goal))
+            if cached is not None:
+                cached_by_id[chunk.chunk_id] = cached
+            else:
+                misses.append(chunk)
+
+        if not misses or not self._cache.semantic:
+            return cached_by_id
+
+        # the semantic tier is an optimization, when it fails the misses just go to the model
+        try:
+            embeddings = self._embed([chunk.text for chunk in misses])
+        except Exception as e:
+            print(f"Error embedding {len(misses)} chunks for the semantic cache: "
+                  f"{str(e)}, treating them as cache misses")
+            return cached_by_id
+
+        scope = self._scope(extraction_goal)
+        for chunk, embedding in zip(misses, embeddings):
+            self._embeddings[chunk.chunk_id] = embedding
+            cached = self._cache.get_similar(scope, embedding)
+            if cached is not None:
+                cached_by_id[chunk.chunk_id] = cached
+
+        return cached_by_id
+
+    def set(self, chunk: ContentChunk, extraction_goal: str, result: Dict[str, Any]):
+        """Store only the model output, chunk_info is rebuilt so timestamps stay current"""
+        self._cache.set(
+            self._key(chunk, extraction_goal),
+            {key: value for key, value in result.items() if key != 'chunk_info'},
+            scope=self._scope(extraction_goal),
+            embedding=self._embeddings.get(chunk.chunk_id)
+        )
+
+    def _key(self, chunk: ContentChunk, extraction_goal: str) -> str:
+        """Key on content rather than chunk position so re-chunked runs still hit"""
+        return LLMCache.make_key(chunk.text, extraction_goal, *self._answer_parts)
+
+    def _scope(self, extraction_goal: str) -> str:
+        """Semantic hits are only valid for the same goal, models and prompt"""
+        return LLMCache.make_key(extraction_goal, *self._answer_parts)
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        """Embeddings for semantic cache lookups, one request for all texts"""
+        # shortened vectors keep the cosine scan over the index cheap
+        response = self._client.embeddings.create(
+            model=self.embedding_model, input=texts, dimensions=256
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+#### utility functions section ##############################################
+
+def _normalize(vector: List[float]) -> List[float]:
+    """Scale to unit length so cosine similarity reduces to a dot product"""
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm else list(vector)
@@ -0,0 +1,41 @@
+import os
+from functools import lru_cache
+from typing import List, Optional
+
+import httpx
+from openai import OpenAI, DefaultHttpxClient
+from dotenv import load_dotenv
+
+#### shared client section ##################################################
+
+# sized above the extractor's worker count so concurrent requests never queue
+# for a connection, idle connections stay warm between batches
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=90)
+# whisper uploads of ~25mb files are slow, so only the connect phase is kept short
+HTTP_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+# the sdk retries 408/409/429/5xx and connection errors with exponential backoff
+# and honours retry-after, so rate limited requests wait instead of failing
+MAX_RETRIES = 5
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: Optional[str] = None) -> OpenAI:
+    """
+    Process-wide OpenAI client, one per api key
+    
+    Built once so every extractor and processor reuses the same keep-alive
+    connection pool, and .env is only read on first use. Without a key the
+    client uses OPENAI_API_KEY.
+    """
+    load_dotenv()
+    return OpenAI(
+        api_key=api_key or os.getenv('OPENAI_API_KEY'),
+        timeout=HTTP_TIMEOUT,
+        max_retries=MAX_RETRIES,
+        # the sdk's client subclass keeps its default transport settings
+        http_client=DefaultHttpxClient(limits=HTTP_LIMITS)
+    )
+
+def get_api_keys() -> List[str]:
+    """Keys from the comma separated OPENAI_API_KEYS, empty when it is not set"""
+    load_dotenv()
+    return [key.strip() for key in os.getenv('OPENAI_API_KEYS', '').split(',') if key.strip()]
@@ -0,0 +1,85 @@
+import unittest
+
+from src.core.chunker import ContentChunker
+from src.processors.youtube import _append_after_seam, extract_video_id
+
+def _words(*timed_words):
+    return [{'word': word, 'start': start, 'end': end} for word, start, end in timed_words]
+
+#### chunk seam tests #######################################################
+
+class AppendAfterSeamTest(unittest.TestCase):
+
+    def setUp(self):
+        # first chunk, its last word ends at 100.0 inside the 99-100s overlap
+        self.segments = [{'start': 95.0, 'end': 100.0, 'text': ' We talked about'}]
+        self.words = _words(('We', 95.0, 95.5), ('talked', 96.0, 96.5), ('about', 99.5, 100.0))
+
+    def test_segment_crossing_the_seam_keeps_only_new_words(self):
+        _append_after_seam(self.segments, self.words, {
+            'segments': [{'start': 99.0, 'end': 102.0, 'text': ' about the book Dune.'}],
+            'words': _words(('about', 99.5, 99.9), ('the', 100.1, 100.3), ('book', 100.4, 100.8), ('Dune.', 101.0, 102.0))
+        })
+
+        self.assertEqual([word['word'] for word in self.words], ['We', 'talked', 'about', 'the', 'book', 'Dune.'])
+        self.assertEqual(self.segments[1], {'start': 100.1, 'end': 102.0, 'text': ' the book Dune.'})
+
+        # the chunker joins segment texts without a separator
+        chunks = ContentChunker().chunk_transcript({'segments': self.segments})
+        self.assertEqual(chunks[0].text.strip(), 'We talked about the book Dune.')
+
+    def test_segment_ending_before_the_seam_is_dropped(self):
+        _append_after_seam(self.segments, self.words, {
+            'segments': [
+                {'start': 99.0, 'end': 99.9, 'text': ' about'},
+                {'start': 100.2, 'end': 101.0, 'text': ' Next topic.'}
+            ],
+            'words': _words(('about', 99.5, 99.9), ('Next', 100.2, 100.5), ('topic.', 100.6, 101.0))
+        })
+
+        self.assertEqual([segment['text'] for segment in self.segments], [' We talked about', ' Next topic.'])
+        self.assertEqual([word['word'] for word in self.words], ['We', 'talked', 'about', 'Next', 'topic.'])
+
+    def test_chunk_without_words_falls_back_to_segment_ends(self):
+        segments = [{'start': 0.0, 'end': 100.0, 'text': ' First part.'}]
+        words = []
+
+        _append_after_seam(segments, words, {
+            'segments': [
+                {'start': 99.0, 'end': 99.8, 'text': ' part.'},
+                {'start': 100.0, 'end': 104.0, 'text': ' Second part.'}
+            ],
+            'words': []
+        })
+
+        self.assertEqual([segment['text'] for segment in segments], [' First part.', ' Second part.'])
+        self.assertEqual(words, [])
+
+#### video id tests ########################################################
+
+class ExtractVideoIdTest(unittest.TestCase):
+
+    def test_url_forms(self):
+        for url in (
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://youtube.com/watch?v=dQw4w9WgXcQ&t=42s',
+            'https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ',
+            'https://youtu.be/dQw4w9WgXcQ?t=10',
+            'https://www.youtube.com/embed/dQw4w9WgXcQ',
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(extract_video_id(url), 'dQw4w9WgXcQ')
+
+    def test_parameter_names_ending_in_v_are_not_the_id(self):
+        self.assertEqual(extract_video_id('https://www.youtube.com/watch?dev=1&v=ID4'), 'ID4')
+        self.assertEqual(extract_video_id('https://www.youtube.com/watch?nav=2&v=ID4&dev=3'), 'ID4')
+
+    def test_first_v_parameter_wins(self):
+        self.assertEqual(extract_video_id('https://www.youtube.com/watch?v=ID1&v=ID2'), 'ID1')
+
+    def test_non_video_urls(self):
+        self.assertIsNone(extract_video_id('https://www.youtube.com/watch?dev=1'))
+        self.assertIsNone(extract_video_id('https://example.com/video'))
+
+if __name__ == '__main__':
+    unittest.main()